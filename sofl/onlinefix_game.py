@@ -31,7 +31,7 @@ from sofl.game_data import GameData
 from sofl.proton.proton_manager import ProtonManager
 from sofl.utils.create_dialog import create_dialog
 from sofl.utils.path_utils import normalize_executable_path
-from sofl.utils.steam_launcher import SteamLauncher
+from sofl.utils.steam_launcher import IN_FLATPAK, SteamLauncher
 
 from gettext import gettext as _
 
@@ -54,8 +54,7 @@ class OnlineFixGameData(GameData):
         """
         # In Flatpak, we can't create prefix next to the game executable
         # because the game path might be read-only. Use a writable location instead.
-        in_flatpak = os.path.exists("/.flatpak-info")
-        if in_flatpak:
+        if IN_FLATPAK:
             # Use Flatpak data directory for Wine prefixes
             import hashlib
             game_path_hash = hashlib.md5(str(game_exec).encode()).hexdigest()[:8]
@@ -95,21 +94,22 @@ class OnlineFixGameData(GameData):
             return
 
         # Determine environment
-        in_flatpak = os.path.exists("/.flatpak-info")
-        host_home = SteamLauncher.get_host_home(in_flatpak)
+        host_home = SteamLauncher.get_host_home()
 
         # Check if Steam is running
-        if not SteamLauncher.check_steam_running(in_flatpak):
-            self._show_steam_not_running_dialog(in_flatpak)
+        if not SteamLauncher.check_steam_running():
+            self._show_steam_not_running_dialog()
             return
 
         # Get Proton settings
         proton_version = shared.schema.get_string("online-fix-proton-version")
         steam_home = os.path.join(host_home, ".local/share/Steam")
 
+        # One manager for the whole launch so its path caches are reused
+        proton_manager = ProtonManager()
+
         # If no Proton version is selected, try to use the first available one
         if not proton_version:
-            proton_manager = ProtonManager()
             available_versions = proton_manager.get_installed_versions()
             if available_versions:
                 proton_version = available_versions[0]
@@ -119,12 +119,11 @@ class OnlineFixGameData(GameData):
                 return
 
         # Check if Proton version is selected and available
-        if not self._check_proton_available(proton_version, steam_home, in_flatpak):
+        if not self._check_proton_available(proton_manager, proton_version, steam_home):
             self._show_proton_manager_dialog()
             return
 
         # Get Proton path
-        proton_manager = ProtonManager()
         proton_path = proton_manager.get_proton_path(proton_version)
         if not proton_path:
             self.log_and_toast(_("Failed to find Proton executable for version {}").format(proton_version))
@@ -132,7 +131,7 @@ class OnlineFixGameData(GameData):
 
         # Create Wine prefix
         prefix_path = self._create_wine_prefix(game_exec)
-        user_home = host_home if in_flatpak else os.path.expanduser("~")
+        user_home = host_home if IN_FLATPAK else os.path.expanduser("~")
 
         # Prepare environment variables
         env = SteamLauncher.prepare_environment(prefix_path, user_home)
@@ -140,11 +139,11 @@ class OnlineFixGameData(GameData):
         # Find Steam Runtime if enabled
         steam_runtime_path = None
         if shared.schema.get_boolean("online-fix-use-steam-runtime"):
-            steam_runtime_path = SteamLauncher.find_steam_runtime(steam_home, in_flatpak)
+            steam_runtime_path = SteamLauncher.find_steam_runtime(steam_home)
             if not steam_runtime_path:
                 # Check default location
                 default_runtime = os.path.join(steam_home, "ubuntu12_32", "steam-runtime", "run.sh")
-                if SteamLauncher._check_file_exists(default_runtime, in_flatpak):
+                if SteamLauncher._check_file_exists(default_runtime):
                     steam_runtime_path = default_runtime
                 else:
                     logging.info("[SOFL] Steam Runtime not found")
@@ -162,7 +161,7 @@ class OnlineFixGameData(GameData):
         )
 
         # Launch game with tracking
-        process = SteamLauncher.launch_game_with_tracking(cmd_argv, env, game_exec.parent, in_flatpak)
+        process = SteamLauncher.launch_game_with_tracking(cmd_argv, env, game_exec.parent)
 
         # Notify window about game launch for tracking
         if hasattr(shared, 'win') and shared.win and process:
@@ -270,17 +269,18 @@ class OnlineFixGameData(GameData):
         logging.info(f"[SOFL] {message}")
         self.create_toast(message)
 
-    def _check_proton_available(self, proton_version: str, steam_home: str, in_flatpak: bool) -> bool:
+    def _check_proton_available(
+        self, proton_manager: ProtonManager, proton_version: str, steam_home: str
+    ) -> bool:
         """Check if Proton version is available using ProtonManager"""
         try:
-            proton_manager = ProtonManager()
             return proton_manager.check_proton_exists(proton_version)
         except Exception as e:
             logging.error(f"[SOFL] Error checking Proton availability: {e}")
             # Fallback to old method
-            return SteamLauncher.check_proton_exists(proton_version, steam_home, in_flatpak)
+            return SteamLauncher.check_proton_exists(proton_version, steam_home)
 
-    def _show_steam_not_running_dialog(self, in_flatpak: bool) -> None:
+    def _show_steam_not_running_dialog(self) -> None:
         """Show dialog when Steam is not running"""
         dialog = Adw.MessageDialog()
         dialog.set_transient_for(shared.win)
@@ -292,15 +292,15 @@ class OnlineFixGameData(GameData):
         dialog.add_response("start_steam", _("Start Steam"))
         dialog.set_response_appearance("start_steam", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_default_response("start_steam")
-        dialog.connect("response", lambda d, r: self._on_steam_dialog_response(r, in_flatpak))
+        dialog.connect("response", lambda d, r: self._on_steam_dialog_response(r))
         dialog.present()
 
-    def _on_steam_dialog_response(self, response: str, in_flatpak: bool) -> None:
+    def _on_steam_dialog_response(self, response: str) -> None:
         """Handle Steam dialog response"""
         if response == "start_steam":
             import subprocess
             try:
-                if in_flatpak:
+                if IN_FLATPAK:
                     # Launch Steam through flatpak-spawn
                     subprocess.Popen(["flatpak-spawn", "--host", "steam"], start_new_session=True)
                 else:
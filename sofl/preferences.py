@@ -21,9 +21,13 @@
 import logging
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
 from sys import platform
+from time import monotonic
 from typing import Any, Callable, Optional
 import os
 import subprocess
@@ -48,6 +52,14 @@ from sofl.proton.proton_manager import ProtonManager
 from sofl.store.managers.sgdb_manager import SgdbManager
 from sofl.utils.create_dialog import create_dialog
 
+# GitHub's published_at is always "YYYY-MM-DDTHH:MM:SSZ", only the date is displayed
+_GH_DATE_FMT = "%Y-%m-%d"
+
+
+@lru_cache(maxsize=64)
+def _format_release_date(published_at: str, fmt: str) -> str:
+    return datetime.strptime(published_at[:10], _GH_DATE_FMT).strftime(fmt)
+
 
 @Gtk.Template(resource_path=shared.PREFIX + "/gtk/preferences.ui")
 class SOFLPreferences(Adw.PreferencesDialog):
@@ -142,9 +154,19 @@ class SOFLPreferences(Adw.PreferencesDialog):
     removed_games: set[Game] = set()
     warning_menu_buttons: dict = {}
     
+    proton_manager_instance: ProtonManager
+
     # Download progress tracking
     active_downloads: dict = {}  # {version_name: {'row': row, 'progress_bar': bar, 'cancel_button': btn}}
 
+    # Bounded pool for the quick GitHub releases fetch only. Downloads run on
+    # their own daemon threads so they neither starve it nor block app exit
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sofl-proton")
+
+    # Available GE-Proton releases shared across dialog instances: (timestamp, versions)
+    _avail_cache: Optional[tuple[float, list]] = None
+    _AVAIL_TTL = 600
+
     is_open = False
 
     def __init__(self, **kwargs: Any) -> None:
@@ -155,6 +177,7 @@ class SOFLPreferences(Adw.PreferencesDialog):
         self.connect("closed", lambda *_: self.set_is_open(False))
 
         self.file_chooser = Gtk.FileDialog()
+        self._folder_dialog: Optional[Gtk.FileDialog] = None
 
         self.toast = Adw.Toast.new(_("All games removed"))
         self.toast.set_button_label(_("Undo"))
@@ -292,8 +315,6 @@ class SOFLPreferences(Adw.PreferencesDialog):
                 "force-theme", "dark" if row.get_active() else "light"
             )
             # (optional) apply theme immediately:
-            from gi.repository import Adw
-
             style_manager = Adw.StyleManager.get_default()
             style_manager.set_color_scheme(
                 Adw.ColorScheme.FORCE_DARK
@@ -650,42 +671,8 @@ class SOFLPreferences(Adw.PreferencesDialog):
                 )
 
     def get_proton_versions(self) -> list[str]:
-        """Get available Proton versions from compatibility.d directory"""
-        # Use ProtonManager if available, otherwise fallback to old method
-        if hasattr(self, 'proton_manager_instance'):
-            return self.proton_manager_instance.get_installed_versions()
-        
-        # Fallback method - use same logic as ProtonManager
-        home = Path.home()
-        steam_paths = [
-            home / ".local/share/Steam/compatibilitytools.d",
-            home / ".steam/root/compatibilitytools.d",
-            home / ".steam/steam/compatibilitytools.d"
-        ]
-        
-        versions = []
-        
-        # Check all possible paths
-        for proton_path in steam_paths:
-            if proton_path.exists() and proton_path.is_dir():
-                try:
-                    for item in proton_path.iterdir():
-                        if item.is_dir() and (
-                            item.name.startswith("GE-Proton") or 
-                            item.name.startswith("Proton")
-                        ):
-                            # Check if it's a valid Proton installation
-                            proton_script = item / "proton"
-                            if proton_script.exists() and proton_script.is_file():
-                                versions.append(item.name)
-                except Exception as e:
-                    logging.error(f"[Preferences] Error reading {proton_path}: {e}")
-        
-        # Remove duplicates and sort
-        versions = list(set(versions))
-        versions.sort(reverse=True)
-        
-        return versions
+        """Get installed Proton versions, setup_proton_manager() runs first in __init__"""
+        return self.proton_manager_instance.get_installed_versions()
 
     def on_auto_patch_changed(self, switch: Adw.SwitchRow, _param: Any) -> None:
         """Show/hide manual settings based on auto-patch switch"""
@@ -699,19 +686,32 @@ class SOFLPreferences(Adw.PreferencesDialog):
     def online_fix_path_browse_handler(self, *_args):
         """Choose directory for Online-Fix games installation"""
 
-        def set_online_fix_dir(_widget: Any, result: Gio.Task) -> None:
+        # Reuse a single dialog across clicks, only the initial folder changes
+        folder_dialog = self._folder_dialog
+        if folder_dialog is None:
+            folder_dialog = self._folder_dialog = Gtk.FileDialog()
+            folder_dialog.set_title(_("Select Online-Fix Folder"))
+            folder_dialog.set_modal(True)
+
+        current_path = self.online_fix_entry_row.get_text()
+        if current_path and os.path.isdir(current_path):
+            folder_dialog.set_initial_folder(Gio.File.new_for_path(current_path))
+
+        def set_online_fix_dir(dialog: Gtk.FileDialog, result: Gio.Task) -> None:
             try:
-                path = Path(self.file_chooser.select_folder_finish(result).get_path())
+                path = Path(dialog.select_folder_finish(result).get_path())
                 shared.schema.set_string("online-fix-install-path", str(path))
                 self.online_fix_entry_row.set_text(str(path))
             except GLib.Error as e:
                 logging.debug("Error selecting folder for Online-Fix: %s", e)
 
-        self.file_chooser.select_folder(shared.win, None, set_online_fix_dir)
+        folder_dialog.select_folder(shared.win, None, set_online_fix_dir)
 
     def setup_proton_manager(self) -> None:
         """Setup Proton Manager functionality"""
         self.proton_manager_instance = ProtonManager()
+        self._download_threads: dict[str, threading.Thread] = {}
+        self._refresh_pending = False
         self.setup_proton_manager_ui()
         self.refresh_proton_versions()
         # Update combo box with installed versions
@@ -733,47 +733,113 @@ class SOFLPreferences(Adw.PreferencesDialog):
         self.proton_manager_group.add(self.proton_installed_expander)
         self.proton_manager_group.add(self.proton_available_expander)
         
-        # Store references to current children for proper cleanup
+        # Version rows keyed by version name / tag_name, reconciled on refresh
+        self._installed_rows: dict[str, Gtk.Widget] = {}
+        self._available_rows: dict[str, Gtk.Widget] = {}
+        # None until the first refresh so the empty state is rendered once
+        self._last_installed: Optional[frozenset[str]] = None
+
+        # Store references to empty/loading/error state widgets for proper cleanup
         self.proton_installed_children = []
         self.proton_available_children = []
         self.proton_loading_spinner = None
 
+    @staticmethod
+    def _make_dim_label(text: str, margin: int = 0) -> Gtk.Label:
+        """Create a dimmed label used for empty/loading/error states"""
+        label = Gtk.Label()
+        label.set_text(text)
+        label.set_css_classes(["dim-label"])
+        if margin:
+            label.set_margin_top(margin)
+            label.set_margin_bottom(margin)
+            label.set_margin_start(margin)
+            label.set_margin_end(margin)
+        return label
+
+    @staticmethod
+    def _make_hbox_with_margins() -> Gtk.Box:
+        """Create a padded horizontal box used for loading/error states"""
+        box = Gtk.Box()
+        box.set_orientation(Gtk.Orientation.HORIZONTAL)
+        box.set_spacing(12)
+        box.set_margin_top(12)
+        box.set_margin_bottom(12)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        return box
+
     def refresh_proton_versions(self) -> None:
         """Refresh both installed and available Proton versions"""
         self.refresh_installed_versions()
         self.refresh_available_versions()
 
+    def _schedule_refresh(self) -> None:
+        """Coalesce bursts of refresh requests into a single refresh"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        GLib.timeout_add(150, self._do_refresh)
+
+    def _do_refresh(self) -> bool:
+        self._refresh_pending = False
+        self.refresh_proton_versions()
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _sync_rows(
+        expander: Adw.ExpanderRow,
+        rows: dict[str, Gtk.Widget],
+        keys: list[str],
+        create_row: Callable[[str], Gtk.Widget],
+    ) -> None:
+        """Make expander rows match keys in order, reusing rows that are kept"""
+        for key in rows.keys() - set(keys):
+            expander.remove(rows.pop(key))
+        if list(rows) == keys:
+            return
+
+        # add_row only appends, so re-add the kept rows around new ones in list order
+        for row in rows.values():
+            expander.remove(row)
+        ordered = {}
+        for key in keys:
+            row = rows.get(key) or create_row(key)
+            expander.add_row(row)
+            ordered[key] = row
+        rows.clear()
+        rows.update(ordered)
+
     def refresh_installed_versions(self) -> None:
         """Refresh the list of installed Proton versions"""
         try:
             logging.info("[Preferences] Refreshing installed Proton versions...")
             installed_versions = self.proton_manager_instance.get_installed_versions()
             logging.info(f"[Preferences] Found {len(installed_versions)} installed versions: {installed_versions}")
+
+            # Nothing changed on disk since the last refresh
+            new_installed = frozenset(installed_versions)
+            if new_installed == self._last_installed:
+                return
+            self._last_installed = new_installed
             
-            # Clear existing children from installed accordion
+            # Reconcile version rows, then drop any previous state widget
+            self._sync_rows(
+                self.proton_installed_expander,
+                self._installed_rows,
+                installed_versions,
+                self.create_installed_version_row,
+            )
             for child in self.proton_installed_children:
                 self.proton_installed_expander.remove(child)
             self.proton_installed_children.clear()
             
             if not installed_versions:
                 # Show simple empty state
-                empty_label = Gtk.Label()
-                empty_label.set_text(_("No Proton versions installed"))
-                empty_label.set_css_classes(["dim-label"])
-                empty_label.set_margin_top(12)
-                empty_label.set_margin_bottom(12)
-                empty_label.set_margin_start(12)
-                empty_label.set_margin_end(12)
+                empty_label = self._make_dim_label(_("No Proton versions installed"), margin=12)
                 
                 self.proton_installed_expander.add_row(empty_label)
                 self.proton_installed_children.append(empty_label)
-                return
-            
-            # Add each installed version
-            for version in installed_versions:
-                row = self.create_installed_version_row(version)
-                self.proton_installed_expander.add_row(row)
-                self.proton_installed_children.append(row)
                 
         except Exception as e:
             logging.error(f"[Preferences] Error refreshing installed versions: {e}")
@@ -783,19 +849,24 @@ class SOFLPreferences(Adw.PreferencesDialog):
         try:
             logging.info("[Preferences] Refreshing available Proton versions...")
             
-            # Clear existing children from available accordion
+            # Clear previous state widget from available accordion
             for child in self.proton_available_children:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
+
+            # Serve recently fetched releases without hitting GitHub again
+            cache = self._avail_cache
+            if cache and monotonic() - cache[0] < self._AVAIL_TTL:
+                GLib.idle_add(self.on_available_versions_loaded, cache[1])
+                return
+
+            # Keep already listed versions visible while fetching
+            if self._available_rows:
+                self._executor.submit(self._fetch_available_versions)
+                return
             
             # Show simple loading state
-            loading_box = Gtk.Box()
-            loading_box.set_orientation(Gtk.Orientation.HORIZONTAL)
-            loading_box.set_spacing(12)
-            loading_box.set_margin_top(12)
-            loading_box.set_margin_bottom(12)
-            loading_box.set_margin_start(12)
-            loading_box.set_margin_end(12)
+            loading_box = self._make_hbox_with_margins()
             
             # Spinner
             spinner = Gtk.Spinner()
@@ -804,32 +875,39 @@ class SOFLPreferences(Adw.PreferencesDialog):
             loading_box.append(spinner)
             
             # Loading label
-            loading_label = Gtk.Label()
-            loading_label.set_text(_("Loading available versions..."))
-            loading_label.set_css_classes(["dim-label"])
+            loading_label = self._make_dim_label(_("Loading available versions..."))
             loading_box.append(loading_label)
             
             self.proton_available_expander.add_row(loading_box)
             self.proton_available_children.append(loading_box)
             
             # Fetch available versions in a separate thread
-            def fetch_versions():
-                try:
-                    logging.info("[Preferences] Fetching available versions in thread...")
-                    available_versions = self.proton_manager_instance.get_available_versions(force_refresh=True)
-                    logging.info(f"[Preferences] Found {len(available_versions)} available versions")
-                    GLib.idle_add(self.on_available_versions_loaded, available_versions)
-                except Exception as e:
-                    logging.error(f"[Preferences] Error in fetch thread: {e}")
-                    GLib.idle_add(self.on_available_versions_error, str(e))
-            
-            thread = threading.Thread(target=fetch_versions)
-            thread.daemon = True
-            thread.start()
+            self._executor.submit(self._fetch_available_versions)
             
         except Exception as e:
             logging.error(f"[Preferences] Error refreshing available versions: {e}")
 
+    def _fetch_available_versions(self) -> None:
+        """Fetch available versions, runs in the worker pool"""
+        try:
+            logging.info("[Preferences] Fetching available versions in thread...")
+            # Only reached once the class cache expired, so bypass the manager's
+            # memo too; the request is conditional and a 304 costs no rate limit
+            manager = self.proton_manager_instance
+            available_versions = manager.get_available_versions(force_refresh=True)
+            logging.info(f"[Preferences] Found {len(available_versions)} available versions")
+            prepared = [
+                self.prepare_available_version_row(version_info)
+                for version_info in available_versions
+            ]
+            # A stale fallback is shown but not cached, the next refresh retries
+            if prepared and not manager.available_versions_stale:
+                type(self)._avail_cache = (monotonic(), prepared)
+            GLib.idle_add(self.on_available_versions_loaded, prepared)
+        except Exception as e:
+            logging.error(f"[Preferences] Error in fetch thread: {e}")
+            GLib.idle_add(self.on_available_versions_error, str(e))
+
     def on_available_versions_loaded(self, versions: list) -> None:
         """Handle loaded available versions"""
         try:
@@ -840,31 +918,24 @@ class SOFLPreferences(Adw.PreferencesDialog):
                 self.proton_loading_spinner.stop()
                 self.proton_loading_spinner = None
             
-            # Clear existing children from available accordion
+            # Reconcile version rows, then drop any previous state widget
+            by_tag = {row_data["tag_name"]: row_data for row_data in versions}
+            self._sync_rows(
+                self.proton_available_expander,
+                self._available_rows,
+                list(by_tag),
+                lambda tag_name: self.create_available_version_row(by_tag[tag_name]),
+            )
             for child in self.proton_available_children:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
             
             if not versions:
                 # Show simple empty state
-                empty_label = Gtk.Label()
-                empty_label.set_text(_("No versions available"))
-                empty_label.set_css_classes(["dim-label"])
-                empty_label.set_margin_top(12)
-                empty_label.set_margin_bottom(12)
-                empty_label.set_margin_start(12)
-                empty_label.set_margin_end(12)
+                empty_label = self._make_dim_label(_("No versions available"), margin=12)
                 
                 self.proton_available_expander.add_row(empty_label)
                 self.proton_available_children.append(empty_label)
-                return
-            
-            # Add each available version
-            for version_info in versions:
-                logging.info(f"[Preferences] Creating row for version: {version_info.get('tag_name', 'unknown')}")
-                row = self.create_available_version_row(version_info)
-                self.proton_available_expander.add_row(row)
-                self.proton_available_children.append(row)
                 
         except Exception as e:
             logging.error(f"[Preferences] Error handling loaded versions: {e}")
@@ -877,19 +948,16 @@ class SOFLPreferences(Adw.PreferencesDialog):
                 self.proton_loading_spinner.stop()
                 self.proton_loading_spinner = None
             
-            # Clear existing children from available accordion
+            # Clear existing rows and state widget from available accordion
+            for row in self._available_rows.values():
+                self.proton_available_expander.remove(row)
+            self._available_rows.clear()
             for child in self.proton_available_children:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
             
             # Show simple error state
-            error_box = Gtk.Box()
-            error_box.set_orientation(Gtk.Orientation.HORIZONTAL)
-            error_box.set_spacing(12)
-            error_box.set_margin_top(12)
-            error_box.set_margin_bottom(12)
-            error_box.set_margin_start(12)
-            error_box.set_margin_end(12)
+            error_box = self._make_hbox_with_margins()
             
             # Error icon
             error_icon = Gtk.Image()
@@ -898,9 +966,7 @@ class SOFLPreferences(Adw.PreferencesDialog):
             error_box.append(error_icon)
             
             # Error label
-            error_label = Gtk.Label()
-            error_label.set_text(_("Failed to load versions. Check your internet connection."))
-            error_label.set_css_classes(["dim-label"])
+            error_label = self._make_dim_label(_("Failed to load versions. Check your internet connection."))
             error_box.append(error_label)
             
             # Retry button
@@ -1047,9 +1113,6 @@ class SOFLPreferences(Adw.PreferencesDialog):
     def on_open_proton_folder(self, button: Gtk.Button, version: str) -> None:
         """Open the Proton version folder in file manager"""
         try:
-            import subprocess
-            import os
-            
             compat_path = self.proton_manager_instance.get_steam_compat_path()
             version_path = os.path.join(compat_path, version)
             
@@ -1096,33 +1159,49 @@ class SOFLPreferences(Adw.PreferencesDialog):
             logging.error(f"[Preferences] Error testing version {version}: {e}")
             self.add_toast(Adw.Toast.new(_("Failed to test version")))
 
-    def create_available_version_row(self, version_info: dict) -> Adw.ActionRow:
-        """Create a simple row for an available Proton version"""
-        row = Adw.ActionRow()
+    @staticmethod
+    def prepare_available_version_row(version_info: dict) -> dict:
+        """Precompute the display strings of an available version row.
+
+        Runs in the fetch worker so the main loop only has to build widgets.
+        """
         tag_name = version_info.get("tag_name", "Unknown")
         name = version_info.get("name", tag_name)
-        row.set_title(name)
-        
+
         # Create subtitle with size and date
         size_bytes = version_info.get("size", 0)
         published_at = version_info.get("published_at", "")
-        
+        size_mb = size_bytes / (1024 * 1024)
+
         subtitle_parts = []
         if size_bytes > 0:
-            size_mb = size_bytes / (1024 * 1024)
             subtitle_parts.append(_("Size: {:.1f} MB").format(size_mb))
-        
+
         if published_at:
             try:
-                from datetime import datetime
-                date_obj = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                formatted_date = date_obj.strftime("%b %d, %Y")
+                formatted_date = _format_release_date(published_at, "%b %d, %Y")
                 subtitle_parts.append(_("Released: {}").format(formatted_date))
-            except:
+            except ValueError:
                 pass
-        
+
         subtitle = " • ".join(subtitle_parts) if subtitle_parts else _("Available for download")
-        row.set_subtitle(subtitle)
+
+        return {
+            "tag_name": tag_name,
+            "name": name,
+            "subtitle": subtitle,
+            "size_mb": size_mb,
+            "version_info": version_info,
+        }
+
+    def create_available_version_row(self, row_data: dict) -> Adw.ActionRow:
+        """Create a simple row for an available Proton version"""
+        tag_name = row_data["tag_name"]
+        version_info = row_data["version_info"]
+
+        row = Adw.ActionRow()
+        row.set_title(row_data["name"])
+        row.set_subtitle(row_data["subtitle"])
         
         # Create a box for buttons
         button_box = Gtk.Box()
@@ -1224,14 +1303,12 @@ class SOFLPreferences(Adw.PreferencesDialog):
             details_grid.attach(date_label, 0, 2, 1, 1)
             
             try:
-                from datetime import datetime
-                date_obj = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                formatted_date = date_obj.strftime("%B %d, %Y")
+                formatted_date = _format_release_date(published_at, "%B %d, %Y")
                 date_value = Gtk.Label()
                 date_value.set_text(formatted_date)
                 date_value.set_halign(Gtk.Align.START)
                 details_grid.attach(date_value, 1, 2, 1, 1)
-            except:
+            except ValueError:
                 pass
         
         # Download count
@@ -1301,7 +1378,6 @@ class SOFLPreferences(Adw.PreferencesDialog):
     def on_view_github_release(self, button: Gtk.Button, version_info: dict) -> None:
         """Open the GitHub release page in browser"""
         try:
-            import subprocess
             html_url = version_info.get("html_url", "")
             if html_url:
                 subprocess.run(["xdg-open", html_url], check=True)
@@ -1314,8 +1390,6 @@ class SOFLPreferences(Adw.PreferencesDialog):
     def on_copy_download_link(self, button: Gtk.Button, version_info: dict) -> None:
         """Copy download link to clipboard"""
         try:
-            import subprocess
-            
             # Find the download URL for the tar.gz file
             assets = version_info.get("assets", [])
             download_url = None
@@ -1381,7 +1455,7 @@ class SOFLPreferences(Adw.PreferencesDialog):
             success = self.proton_manager_instance.delete_version(version)
             if success:
                 self.add_toast(Adw.Toast.new(_("{} deleted").format(version)))
-                self.refresh_installed_versions()
+                self._schedule_refresh()
                 self.update_proton_combo()
             else:
                 self.add_toast(Adw.Toast.new(_("Failed to delete {}").format(version)))
@@ -1409,6 +1483,12 @@ class SOFLPreferences(Adw.PreferencesDialog):
         """Handle download Proton version button click"""
         try:
             tag_name = version_info.get("tag_name", "Unknown")
+
+            # Reuse the pending download for this version instead of starting another
+            pending = self._download_threads.get(tag_name)
+            if pending is not None and pending.is_alive():
+                logging.info(f"[Preferences] Download for {tag_name} already in progress")
+                return
             
             # Hide download button, show progress bar and cancel button
             button.set_visible(False)
@@ -1454,6 +1534,7 @@ class SOFLPreferences(Adw.PreferencesDialog):
                         GLib.idle_add(self.on_download_error, version_info, str(e), button, progress_bar, cancel_button)
             
             thread = threading.Thread(target=download_thread, daemon=True)
+            self._download_threads[tag_name] = thread
             thread.start()
             
         except Exception as e:
@@ -1465,7 +1546,7 @@ class SOFLPreferences(Adw.PreferencesDialog):
         try:
             tag_name = version_info.get("tag_name", "Unknown")
             self.add_toast(Adw.Toast.new(_("Version {} downloaded successfully").format(tag_name)))
-            self.refresh_installed_versions()
+            self._schedule_refresh()
             self.update_proton_combo()
             
             # Hide progress bar and cancel button, show download button
@@ -1508,7 +1589,8 @@ class SOFLPreferences(Adw.PreferencesDialog):
 
     def on_proton_retry_clicked(self, button: Gtk.Button) -> None:
         """Handle retry button click"""
-        self.refresh_available_versions()
+        type(self)._avail_cache = None
+        self._schedule_refresh()
 
     def update_proton_combo(self) -> None:
         """Update the Proton combo box with current installed versions"""
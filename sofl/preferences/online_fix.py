@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
+import logging
+import os
+from pathlib import Path
 from typing import Any
 
-from gi.repository import Adw, Gio
+from gi.repository import Adw, Gio, GLib, Gtk
 
 from sofl import shared
 
 
 class OnlineFixSectionMixin:
+    _folder_dialog: Gtk.FileDialog | None = None
+
     def _init_online_fix_section(self) -> None:
         self.setup_online_fix_settings()
 
     def setup_online_fix_settings(self) -> None:
-        from pathlib import Path
-        from gi.repository import GLib
-
         try:
             current_path = shared.schema.get_string("online-fix-install-path")
         except GLib.Error:
@@ -83,21 +85,26 @@ class OnlineFixSectionMixin:
         shared.schema.set_string("online-fix-dll-overrides", entry.get_text())
 
     def online_fix_path_browse_handler(self, *_args: Any) -> None:
-        from pathlib import Path
-        from gi.repository import GLib
+        folder_dialog = self._folder_dialog
+        if folder_dialog is None:
+            folder_dialog = self._folder_dialog = Gtk.FileDialog()
+            folder_dialog.set_title(_("Select Online-Fix Folder"))
+            folder_dialog.set_modal(True)
 
-        def set_online_fix_dir(_widget: Any, result: Gio.Task) -> None:
+        current_path = self.online_fix_entry_row.get_text()
+        if current_path and os.path.isdir(current_path):
+            folder_dialog.set_initial_folder(Gio.File.new_for_path(current_path))
+
+        def set_online_fix_dir(dialog: Gtk.FileDialog, result: Gio.Task) -> None:
             try:
-                path = Path(self.file_chooser.select_folder_finish(result).get_path())
+                path = Path(dialog.select_folder_finish(result).get_path())
                 shared.schema.set_string("online-fix-install-path", str(path))
                 self.online_fix_entry_row.set_text(str(path))
             except GLib.Error as error:
-                import logging
-
                 logging.debug(
                     "Error selecting folder for Online-Fix: %s", error
                 )
 
-        self.file_chooser.select_folder(shared.win, None, set_online_fix_dir)
+        folder_dialog.select_folder(shared.win, None, set_online_fix_dir)
 
 
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-import threading
-from typing import Any, Iterable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
 
 from gi.repository import Adw, Gio, GLib, Gtk
 
@@ -16,9 +17,16 @@ class ProtonSectionMixin:
     proton_manager_instance: ProtonManager
     active_downloads: dict
 
+    # Releases fetch only
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sofl-proton")
+
+    _avail_cache: tuple[float, list] | None = None
+    _AVAIL_TTL = 600
+
     def _init_proton_section(self) -> None:
         self.proton_manager_instance = ProtonManager()
         self.active_downloads = {}
+        self._refresh_pending = False
 
         self.proton_installed_expander = Adw.ExpanderRow()
         self.proton_installed_expander.set_title(_("Installed Versions"))
@@ -35,41 +43,107 @@ class ProtonSectionMixin:
         self.proton_manager_group.add(self.proton_installed_expander)
         self.proton_manager_group.add(self.proton_available_expander)
 
+        self._installed_rows: dict[str, Gtk.Widget] = {}
+        self._available_rows: dict[str, Gtk.Widget] = {}
+        self._last_installed: frozenset[str] | None = None
+
         self.proton_installed_children: list[Gtk.Widget] = []
         self.proton_available_children: list[Gtk.Widget] = []
         self.proton_loading_spinner: Gtk.Spinner | None = None
 
         self.refresh_proton_versions()
 
+    @staticmethod
+    def _make_dim_label(text: str, margin: int = 0) -> Gtk.Label:
+        label = Gtk.Label()
+        label.set_text(text)
+        label.set_css_classes(["dim-label"])
+        if margin:
+            label.set_margin_top(margin)
+            label.set_margin_bottom(margin)
+            label.set_margin_start(margin)
+            label.set_margin_end(margin)
+        return label
+
+    @staticmethod
+    def _make_hbox_with_margins() -> Gtk.Box:
+        box = Gtk.Box()
+        box.set_orientation(Gtk.Orientation.HORIZONTAL)
+        box.set_spacing(12)
+        box.set_margin_top(12)
+        box.set_margin_bottom(12)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        return box
+
+    @staticmethod
+    def _sync_rows(
+        expander: Adw.ExpanderRow,
+        rows: dict[str, Gtk.Widget],
+        keys: list[str],
+        create_row: Callable[[str], Gtk.Widget],
+    ) -> None:
+        for key in rows.keys() - set(keys):
+            expander.remove(rows.pop(key))
+        if list(rows) == keys:
+            return
+
+        # add_row only appends, so re-add the kept rows around new ones in list order
+        for row in rows.values():
+            expander.remove(row)
+        ordered = {}
+        for key in keys:
+            row = rows.get(key) or create_row(key)
+            expander.add_row(row)
+            ordered[key] = row
+        rows.clear()
+        rows.update(ordered)
+
     def refresh_proton_versions(self) -> None:
         self.refresh_installed_versions()
         self.refresh_available_versions()
 
+    def _schedule_refresh(self) -> None:
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        GLib.timeout_add(150, self._do_refresh)
+
+    def _do_refresh(self) -> bool:
+        self._refresh_pending = False
+        self.refresh_proton_versions()
+        return GLib.SOURCE_REMOVE
+
+    def on_proton_retry_clicked(self, _button: Gtk.Button) -> None:
+        type(self)._avail_cache = None
+        self._schedule_refresh()
+
     def refresh_installed_versions(self) -> None:
         try:
             installed_versions = self.proton_manager_instance.get_installed_versions()
 
+            new_installed = frozenset(installed_versions)
+            if new_installed == self._last_installed:
+                return
+            self._last_installed = new_installed
+
+            self._sync_rows(
+                self.proton_installed_expander,
+                self._installed_rows,
+                installed_versions,
+                self.create_installed_version_row,
+            )
             for child in self.proton_installed_children:
                 self.proton_installed_expander.remove(child)
             self.proton_installed_children.clear()
 
             if not installed_versions:
-                empty_label = Gtk.Label()
-                empty_label.set_text(_("No Proton versions installed"))
-                empty_label.set_css_classes(["dim-label"])
-                empty_label.set_margin_top(12)
-                empty_label.set_margin_bottom(12)
-                empty_label.set_margin_start(12)
-                empty_label.set_margin_end(12)
+                empty_label = self._make_dim_label(
+                    _("No Proton versions installed"), margin=12
+                )
 
                 self.proton_installed_expander.add_row(empty_label)
                 self.proton_installed_children.append(empty_label)
-                return
-
-            for version in installed_versions:
-                row = self.create_installed_version_row(version)
-                self.proton_installed_expander.add_row(row)
-                self.proton_installed_children.append(row)
 
         except Exception as error:  # noqa: BLE001
             logging.error(
@@ -82,74 +156,66 @@ class ProtonSectionMixin:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
 
-            loading_box = Gtk.Box()
-            loading_box.set_orientation(Gtk.Orientation.HORIZONTAL)
-            loading_box.set_spacing(12)
-            loading_box.set_margin_top(12)
-            loading_box.set_margin_bottom(12)
-            loading_box.set_margin_start(12)
-            loading_box.set_margin_end(12)
+            cache = self._avail_cache
+            if cache and time.monotonic() - cache[0] < self._AVAIL_TTL:
+                GLib.idle_add(self.on_available_versions_loaded, cache[1])
+                return
+
+            if self._available_rows:
+                self._executor.submit(self._fetch_available_versions)
+                return
+
+            loading_box = self._make_hbox_with_margins()
 
             spinner = Gtk.Spinner()
             spinner.start()
             self.proton_loading_spinner = spinner
             loading_box.append(spinner)
 
-            loading_label = Gtk.Label()
-            loading_label.set_text(_("Loading available versions..."))
-            loading_label.set_css_classes(["dim-label"])
+            loading_label = self._make_dim_label(_("Loading available versions..."))
             loading_box.append(loading_label)
 
             self.proton_available_expander.add_row(loading_box)
             self.proton_available_children.append(loading_box)
 
-            def fetch_versions() -> None:
-                try:
-                    available_versions = self.proton_manager_instance.get_available_versions(
-                        force_refresh=True
-                    )
-                    GLib.idle_add(
-                        self.on_available_versions_loaded, available_versions
-                    )
-                except Exception as error:  # noqa: BLE001
-                    logging.error("[Preferences] Error in fetch thread: %s", error)
-                    GLib.idle_add(
-                        self.on_available_versions_error, str(error)
-                    )
-
-            thread = threading.Thread(target=fetch_versions, daemon=True)
-            thread.start()
+            self._executor.submit(self._fetch_available_versions)
 
         except Exception as error:  # noqa: BLE001
             logging.error("[Preferences] Error refreshing available versions: %s", error)
 
+    def _fetch_available_versions(self) -> None:
+        try:
+            manager = self.proton_manager_instance
+            available_versions = manager.get_available_versions(force_refresh=True)
+            if available_versions and not manager.available_versions_stale:
+                type(self)._avail_cache = (time.monotonic(), available_versions)
+            GLib.idle_add(self.on_available_versions_loaded, available_versions)
+        except Exception as error:  # noqa: BLE001
+            logging.error("[Preferences] Error in fetch thread: %s", error)
+            GLib.idle_add(self.on_available_versions_error, str(error))
+
     def on_available_versions_loaded(self, versions: list) -> None:
         try:
             if self.proton_loading_spinner:
                 self.proton_loading_spinner.stop()
                 self.proton_loading_spinner = None
 
+            by_tag = {version_info["tag_name"]: version_info for version_info in versions}
+            self._sync_rows(
+                self.proton_available_expander,
+                self._available_rows,
+                list(by_tag),
+                lambda tag_name: self.create_available_version_row(by_tag[tag_name]),
+            )
             for child in self.proton_available_children:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
 
             if not versions:
-                empty_label = Gtk.Label()
-                empty_label.set_text(_("No versions available"))
-                empty_label.set_css_classes(["dim-label"])
-                empty_label.set_margin_top(12)
-                empty_label.set_margin_bottom(12)
-                empty_label.set_margin_start(12)
-                empty_label.set_margin_end(12)
+                empty_label = self._make_dim_label(_("No versions available"), margin=12)
 
                 self.proton_available_expander.add_row(empty_label)
                 self.proton_available_children.append(empty_label)
-                return
-
-            for version_info in versions:
-                row = self.create_available_version_row(version_info)
-                self.proton_available_expander.add_row(row)
-                self.proton_available_children.append(row)
 
         except Exception as error:  # noqa: BLE001
             logging.error("[Preferences] Error handling loaded versions: %s", error)
@@ -160,28 +226,23 @@ class ProtonSectionMixin:
                 self.proton_loading_spinner.stop()
                 self.proton_loading_spinner = None
 
+            for row in self._available_rows.values():
+                self.proton_available_expander.remove(row)
+            self._available_rows.clear()
             for child in self.proton_available_children:
                 self.proton_available_expander.remove(child)
             self.proton_available_children.clear()
 
-            error_box = Gtk.Box()
-            error_box.set_orientation(Gtk.Orientation.HORIZONTAL)
-            error_box.set_spacing(12)
-            error_box.set_margin_top(12)
-            error_box.set_margin_bottom(12)
-            error_box.set_margin_start(12)
-            error_box.set_margin_end(12)
+            error_box = self._make_hbox_with_margins()
 
             error_icon = Gtk.Image()
             error_icon.set_from_icon_name("network-error-symbolic")
             error_icon.set_pixel_size(16)
             error_box.append(error_icon)
 
-            error_label = Gtk.Label()
-            error_label.set_text(
+            error_label = self._make_dim_label(
                 _("Failed to load versions. Check your internet connection.")
             )
-            error_label.set_css_classes(["dim-label"])
             error_box.append(error_label)
 
             retry_button = Gtk.Button()
@@ -17,6 +17,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import importlib.util
+import io
 import json
 import logging
 import os
@@ -24,12 +26,147 @@ import shutil
 import subprocess
 import tarfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
-from typing import Callable, List, Optional, Dict, Any
-from urllib.request import urlopen, urlretrieve
-from urllib.error import URLError
+from time import monotonic, time
+from typing import Callable, List, Optional, Dict, Any, Tuple
+
+import requests
+from requests.exceptions import RequestException
 
 from sofl import shared
+from sofl.utils.steam_launcher import IN_FLATPAK, SteamLauncher
+
+# Stream and copy buffer for extracting multi-hundred-MB GE-Proton archives
+_TAR_BUFSIZE = 2 * 1024 * 1024
+
+# Directory name prefixes of Proton builds in compatibilitytools.d and
+# steamapps/common, passed to str.startswith as a single tuple
+_PROTON_PREFIXES = ("Proton", "GE-Proton")
+_STEAM_PROTON_PREFIXES = ("Proton",)
+
+# python-zstandard is optional, .tar.zst assets are only preferred when it is present
+_ARCHIVE_EXTENSIONS = (
+    (".tar.zst", ".tar.gz") if importlib.util.find_spec("zstandard") else (".tar.gz",)
+)
+
+
+class _ProgressReader(io.RawIOBase):
+    """Readable stream wrapper reporting how much of a stream has been consumed.
+
+    Reports are capped at about 50 per second, each one ends up as a
+    GLib.idle_add on the UI thread.
+    """
+
+    MIN_INTERVAL = 0.02
+
+    def __init__(
+        self,
+        raw: Any,
+        total_size: int,
+        progress_callback: Optional[Callable[[float], None]],
+    ) -> None:
+        super().__init__()
+        self._raw = raw
+        self._total_size = total_size
+        self._progress_callback = progress_callback
+        self._bytes_read = 0
+        self._last_emit = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self._bytes_read += len(chunk)
+        if self._progress_callback and self._total_size > 0:
+            progress = min(self._bytes_read / self._total_size, 1.0)
+            now = monotonic()
+            if progress >= 1.0 or now - self._last_emit >= self.MIN_INTERVAL:
+                self._last_emit = now
+                self._progress_callback(progress)
+        return chunk
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def readable(self) -> bool:
+        return True
+
+
+def _scan_proton_dirs(root: Path, prefixes: tuple[str, ...]) -> Dict[str, Path]:
+    """Valid Proton installations directly under root, mapped to their proton script.
+
+    Uses os.scandir so the directory type comes from the cached dirent and
+    only the proton script needs a stat() of its own.
+    """
+    found = {}
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefixes) and entry.is_dir():
+                    proton_path = os.path.join(entry.path, "proton")
+                    if os.path.isfile(proton_path):
+                        found[entry.name] = Path(proton_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"[ProtonManager] Error reading {root}: {e}")
+    return found
+
+
+def _dir_size(root: str) -> int:
+    """Total size of regular files below root, without following symlinks"""
+    total = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _parallel_dir_size(root: str) -> int:
+    """Like _dir_size, but walks top-level subdirectories on a thread pool.
+
+    The walk is stat()-bound and os.scandir releases the GIL, so overlapping
+    the syscalls pays off on large trees and network-backed Steam libraries.
+    """
+    total = 0
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+
+    if len(subdirs) <= 4:
+        return total + sum(map(_dir_size, subdirs))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return total + sum(executor.map(_dir_size, subdirs))
+
+
+def _path_cached(method: Callable) -> Callable:
+    """Memoize a filesystem lookup on the instance for PATH_CACHE_TTL seconds"""
+
+    @wraps(method)
+    def wrapper(self: "ProtonManager", *args: Any) -> Any:
+        key = (method.__name__, *args)
+        hit = self._path_cache.get(key)
+        if hit and monotonic() - hit[0] < self.PATH_CACHE_TTL:
+            value = hit[1]
+        else:
+            value = method(self, *args)
+            self._path_cache[key] = (monotonic(), value)
+        # Callers get their own copy of cached lists
+        return list(value) if isinstance(value, list) else value
+
+    return wrapper
 
 
 class ProtonManager:
@@ -37,27 +174,59 @@ class ProtonManager:
     
     GITHUB_API_URL = "https://api.github.com/repos/GloriousEggroll/proton-ge-custom/releases"
     MAX_AVAILABLE_VERSIONS = 10
+    PATH_CACHE_TTL = 5
+    # Skip even the conditional GitHub request when the disk cache is this fresh
+    RELEASES_CACHE_TTL = 600
+
+    # Process-wide session so repeated GitHub requests reuse the pooled TLS connection
+    _session = requests.Session()
     
     def __init__(self):
         self._cached_available_versions: Optional[List[Dict[str, Any]]] = None
+        # Set when get_available_versions fell back to an outdated disk cache
+        self.available_versions_stale = False
+        self._path_cache: Dict[tuple, tuple[float, Any]] = {}
+
+        self._candidates: Optional[Tuple[List[Path], List[Path]]] = None
+
+    def invalidate_path_cache(self) -> None:
+        """Forget cached lookups after versions were installed or removed"""
+        self._path_cache.clear()
+
+    def _build_candidates(self) -> Tuple[List[Path], List[Path]]:
+        """Resolve the compatibilitytools.d and steamapps/common directories
+        Proton versions may live in, once.
+
+        ~/.steam/steam is usually a symlink into ~/.local/share/Steam, so
+        candidates are de-duplicated by real path to avoid scanning twice.
+        """
+        if self._candidates is not None:
+            return self._candidates
+
+        def unique(paths: List[Path]) -> List[Path]:
+            real = dict.fromkeys(os.path.realpath(path) for path in paths)
+            return [Path(path) for path in real]
+
+        home = Path.home()
+        compat_candidates = unique([
+            self.get_steam_compat_path(),  # User path
+            Path("/usr/share/steam/compatibilitytools.d"),  # System path
+        ])
+        common_candidates = unique([
+            home / ".local/share/Steam/steamapps/common",
+            home / ".steam/steam/steamapps/common",
+        ])
+        self._candidates = (compat_candidates, common_candidates)
+        return self._candidates
     
+    @_path_cached
     def get_steam_compat_path(self) -> Path:
         """Get the correct path to compatibilitytools.d directory"""
-        in_flatpak = os.path.exists("/.flatpak-info")
-        
-        if in_flatpak:
-            # In flatpak, try to get host home directory
-            try:
-                result = subprocess.run(
-                    ["flatpak-spawn", "--host", "printenv", "HOME"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    host_home = result.stdout.strip()
-                    return Path(host_home) / ".local/share/Steam/compatibilitytools.d"
-            except Exception as e:
-                logging.error(f"[ProtonManager] Failed to get host home: {e}")
+        if IN_FLATPAK:
+            # In flatpak, use the host home directory. SteamLauncher memoizes
+            # it process-wide, so new managers don't fork flatpak-spawn again
+            host_home = SteamLauncher.get_host_home(True)
+            return Path(host_home) / ".local/share/Steam/compatibilitytools.d"
         
         # Fallback to standard paths
         home = Path.home()
@@ -74,93 +243,154 @@ class ProtonManager:
         # Return the most common path if none exist
         return steam_paths[0]
     
-    def get_installed_versions(self) -> List[str]:
-        """Get list of installed Proton versions"""
-        versions = []
+    @_path_cached
+    def _version_index(self) -> Dict[str, Path]:
+        """Map every installed Proton version to its proton script in one scan"""
+        index: Dict[str, Path] = {}
+        compat_candidates, common_candidates = self._build_candidates()
 
-        # Check compatibilitytools.d directories for GE-Proton (user and system)
-        compat_paths = [
-            self.get_steam_compat_path(),  # User path
-            Path("/usr/share/steam/compatibilitytools.d")  # System path
-        ]
+        # compatibilitytools.d (user, then system) wins over steamapps/common
+        for compat_path in compat_candidates:
+            for name, proton_path in _scan_proton_dirs(compat_path, _PROTON_PREFIXES).items():
+                index.setdefault(name, proton_path)
 
-        for compat_path in compat_paths:
-            if compat_path.exists():
-                try:
-                    for item in compat_path.iterdir():
-                        if item.is_dir() and (
-                            item.name.startswith("GE-Proton") or
-                            item.name.startswith("Proton")
-                        ):
-                            # Check if it's a valid Proton installation
-                            proton_script = item / "proton"
-                            if proton_script.exists() and proton_script.is_file():
-                                versions.append(item.name)
-                except Exception as e:
-                    logging.error(f"[ProtonManager] Error reading {compat_path}: {e}")
-        
         # Also check Steam's common directory for standard Proton
-        home = Path.home()
-        steam_common_paths = [
-            home / ".local/share/Steam/steamapps/common",
-            home / ".steam/steam/steamapps/common"
-        ]
-        
-        for common_path in steam_common_paths:
-            if common_path.exists():
-                try:
-                    for item in common_path.iterdir():
-                        if item.is_dir() and item.name.startswith("Proton"):
-                            # Check if it's a valid Proton installation
-                            proton_script = item / "proton"
-                            if proton_script.exists() and proton_script.is_file():
-                                versions.append(item.name)
-                except Exception as e:
-                    logging.error(f"[ProtonManager] Error reading {common_path}: {e}")
-        
-        # Remove duplicates and sort
-        versions = list(set(versions))
-        versions.sort(reverse=True)
-        
-        return versions
+        for common_path in common_candidates:
+            for name, proton_path in _scan_proton_dirs(common_path, _STEAM_PROTON_PREFIXES).items():
+                index.setdefault(name, proton_path)
+
+        return index
+
+    def get_installed_versions(self) -> List[str]:
+        """Get list of installed Proton versions"""
+        return sorted(self._version_index(), reverse=True)
     
+    @staticmethod
+    def _releases_cache_path() -> Path:
+        return shared.cache_dir / "sofl" / "proton_releases.json"
+
+    def _load_releases_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the on-disk release cache written by a previous fetch"""
+        try:
+            with self._releases_cache_path().open("r", encoding="utf-8") as file:
+                cache = json.load(file)
+            if isinstance(cache.get("versions"), list):
+                return cache
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"[ProtonManager] Ignoring unreadable releases cache: {e}")
+        return None
+
+    def _save_releases_cache(
+        self, versions: List[Dict[str, Any]], etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        cache_path = self._releases_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # The temp file lives next to the cache so the final replace is an
+            # atomic rename and a crash never leaves a truncated cache behind
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(
+                        {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "fetched_at": time(),
+                            "versions": versions,
+                        },
+                        file,
+                    )
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logging.warning(f"[ProtonManager] Failed to write releases cache: {e}")
+
     def get_available_versions(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
-        """Get list of available GE-Proton versions from GitHub"""
+        """Get list of available GE-Proton versions from GitHub.
+
+        Uses a conditional request against the on-disk cache, a 304 response
+        does not count against GitHub's unauthenticated rate limit.
+        """
+        self.available_versions_stale = False
         if self._cached_available_versions and not force_refresh:
             return self._cached_available_versions
+
+        cache = self._load_releases_cache()
+        if (
+            cache
+            and not force_refresh
+            and time() - cache.get("fetched_at", 0) < self.RELEASES_CACHE_TTL
+        ):
+            self._cached_available_versions = cache["versions"]
+            return cache["versions"]
+
+        headers = {"Accept": "application/vnd.github+json"}
+        if cache:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
         
         try:
-            with urlopen(self.GITHUB_API_URL) as response:
-                data = json.loads(response.read().decode())
-            
-            versions = []
-            for release in data[:self.MAX_AVAILABLE_VERSIONS]:
-                # Find tar.gz asset
-                tar_asset = None
-                for asset in release.get("assets", []):
-                    if asset["name"].endswith(".tar.gz"):
-                        tar_asset = asset
-                        break
-                
-                if tar_asset:
-                    versions.append({
-                        "tag_name": release["tag_name"],
-                        "name": release["name"],
-                        "published_at": release["published_at"],
-                        "download_url": tar_asset["browser_download_url"],
-                        "size": tar_asset["size"],
-                        "download_count": tar_asset["download_count"]
-                    })
-            
+            response = self._session.get(self.GITHUB_API_URL, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cache:
+                versions = cache["versions"]
+                etag = cache.get("etag")
+                last_modified = cache.get("last_modified")
+            else:
+                response.raise_for_status()
+                data = response.json()
+
+                versions = []
+                for release in data[:self.MAX_AVAILABLE_VERSIONS]:
+                    # Find the preferred tarball asset
+                    tar_asset = archive = None
+                    for extension in _ARCHIVE_EXTENSIONS:
+                        for asset in release.get("assets", []):
+                            if asset["name"].endswith(extension):
+                                tar_asset, archive = asset, extension
+                                break
+                        if tar_asset:
+                            break
+
+                    if tar_asset:
+                        versions.append({
+                            "tag_name": release["tag_name"],
+                            "name": release["name"],
+                            "published_at": release["published_at"],
+                            "download_url": tar_asset["browser_download_url"],
+                            "size": tar_asset["size"],
+                            "download_count": tar_asset["download_count"],
+                            "archive": archive,
+                            "content_type": tar_asset.get("content_type"),
+                        })
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+            self._save_releases_cache(versions, etag, last_modified)
             self._cached_available_versions = versions
             return versions
             
-        except URLError as e:
+        except RequestException as e:
             logging.error(f"[ProtonManager] Failed to fetch available versions: {e}")
-            return []
         except Exception as e:
             logging.error(f"[ProtonManager] Error parsing available versions: {e}")
-            return []
+
+        # Rate limited, offline or a bad payload: a stale list beats an empty one.
+        # It is not memoized, so the next call asks GitHub again
+        if cache:
+            logging.info("[ProtonManager] Using cached available versions")
+            self.available_versions_stale = True
+            return cache["versions"]
+        return []
     
     def download_version(self, version_info: Dict[str, Any], progress_callback: Optional[Callable[[float], None]] = None) -> bool:
         """Download and install a Proton version"""
@@ -172,35 +402,108 @@ class ProtonManager:
             compat_path = self.get_steam_compat_path()
             compat_path.mkdir(parents=True, exist_ok=True)
 
-            # Create temporary directory for download
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                tar_file = temp_path / f"{tag_name}.tar.gz"
-
-                # Download with progress
-                def download_progress(block_num, block_size, total_size):
-                    if progress_callback and total_size > 0:
-                        progress = (block_num * block_size) / total_size
-                        progress_callback(min(progress, 1.0))
+            logging.info(f"[ProtonManager] Downloading and extracting {tag_name}...")
+            with self._session.get(
+                version_info["download_url"], stream=True, timeout=30
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                total_size = int(response.headers.get("Content-Length", 0))
+                reader = _ProgressReader(response.raw, total_size, progress_callback)
 
-                logging.info(f"[ProtonManager] Downloading {tag_name}...")
-                urlretrieve(version_info["download_url"], tar_file, download_progress)
+                # Extract while downloading into a hidden staging directory on the
+                # same filesystem, so a failed or cancelled download leaves no
+                # half-extracted version behind and the final move is a rename
+                with tempfile.TemporaryDirectory(dir=compat_path, prefix=".sofl-") as staging:
+                    if version_info.get("archive") == ".tar.zst":
+                        self._extract_zst_with_tarfile(reader, staging)
+                    elif shutil.which("tar"):
+                        self._extract_with_tar(reader, staging)
+                    else:
+                        self._extract_with_tarfile(reader, staging)
 
-                if progress_callback:
-                    progress_callback(1.0)
+                    if progress_callback:
+                        progress_callback(1.0)
 
-                # Extract to compatibilitytools.d
-                logging.info(f"[ProtonManager] Extracting {tag_name}...")
-                with tarfile.open(tar_file, "r:gz") as tar:
-                    tar.extractall(compat_path)
+                    for entry in os.listdir(staging):
+                        target = compat_path / entry
+                        if target.exists():
+                            shutil.rmtree(target)
+                        os.replace(os.path.join(staging, entry), target)
 
-                logging.info(f"[ProtonManager] Successfully installed {tag_name}")
-                return True
+            logging.info(f"[ProtonManager] Successfully installed {tag_name}")
+            return True
 
         except Exception as e:
             logging.error(f"[ProtonManager] Failed to download {tag_name}: {e}")
             return False
+        finally:
+            self.invalidate_path_cache()
     
+    @staticmethod
+    def _extract_with_tar(reader: _ProgressReader, destination: str) -> None:
+        """Pipe a .tar.gz stream into the native tar binary"""
+        # stderr goes to a file: a pipe nobody reads while stdin is being fed
+        # fills up on per-file errors (e.g. disk full) and deadlocks both sides
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                ["tar", "-xzf", "-", "-C", destination],
+                stdin=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+            stdin = process.stdin
+            assert stdin is not None
+            try:
+                while chunk := reader.read(_TAR_BUFSIZE):
+                    stdin.write(chunk)
+            except BrokenPipeError:
+                # tar exited early, its own message is reported below
+                pass
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                # Closing flushes the buffered tail, which fails the same way
+                # once tar is gone; left open it would be flushed at GC instead
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    pass
+
+            if process.wait() != 0:
+                # Keep the tail, per-file errors can run to hundreds of KB
+                stderr_file.seek(max(stderr_file.seek(0, os.SEEK_END) - 4096, 0))
+                stderr = stderr_file.read().decode(errors="replace").strip()
+                raise RuntimeError(f"tar exited with code {process.returncode}: {stderr}")
+
+    @staticmethod
+    def _extract_with_tarfile(reader: _ProgressReader, destination: str) -> None:
+        """Extract a .tar.gz stream with the pure-Python tarfile module"""
+        # copybufsize is passed on to TarFile, the stream-mode stub just omits it
+        with tarfile.open(  # type: ignore[call-overload]
+            fileobj=reader,
+            mode="r|gz",
+            bufsize=_TAR_BUFSIZE,
+            copybufsize=_TAR_BUFSIZE,
+        ) as tar:
+            tar.extractall(destination)
+
+    @staticmethod
+    def _extract_zst_with_tarfile(reader: _ProgressReader, destination: str) -> None:
+        """Extract a .tar.zst stream, decompressing with python-zstandard"""
+        import zstandard
+
+        decompressor = zstandard.ZstdDecompressor()
+        with decompressor.stream_reader(reader, read_size=_TAR_BUFSIZE) as stream:
+            with tarfile.open(  # type: ignore[call-overload]
+                fileobj=stream,
+                mode="r|",
+                bufsize=_TAR_BUFSIZE,
+                copybufsize=_TAR_BUFSIZE,
+            ) as tar:
+                tar.extractall(destination)
+
     def delete_version(self, version: str) -> bool:
         """Delete an installed Proton version"""
         try:
@@ -208,25 +511,19 @@ class ProtonManager:
             compat_path = self.get_steam_compat_path()
             version_path = compat_path / version
 
-            if version_path.exists():
+            if os.path.isdir(version_path):
                 shutil.rmtree(version_path)
                 logging.info(f"[ProtonManager] Successfully deleted {version} from compatibilitytools.d")
                 return True
 
             # If not found in compatibilitytools.d, try steamapps/common (official versions)
-            home = Path.home()
-            steam_common_paths = [
-                home / ".local/share/Steam/steamapps/common",
-                home / ".steam/steam/steamapps/common"
-            ]
-
-            for common_path in steam_common_paths:
-                if common_path.exists():
-                    version_path = common_path / version
-                    if version_path.exists():
-                        shutil.rmtree(version_path)
-                        logging.info(f"[ProtonManager] Successfully deleted {version} from {common_path}")
-                        return True
+            _, common_candidates = self._build_candidates()
+            for common_path in common_candidates:
+                version_path = common_path / version
+                if os.path.isdir(version_path):
+                    shutil.rmtree(version_path)
+                    logging.info(f"[ProtonManager] Successfully deleted {version} from {common_path}")
+                    return True
 
             # Version not found in any location
             logging.warning(f"[ProtonManager] Version {version} not found in any location")
@@ -235,6 +532,8 @@ class ProtonManager:
         except Exception as e:
             logging.error(f"[ProtonManager] Failed to delete {version}: {e}")
             return False
+        finally:
+            self.invalidate_path_cache()
     
     def check_proton_available(self) -> bool:
         """Check if at least one Proton version is available"""
@@ -242,31 +541,7 @@ class ProtonManager:
     
     def get_proton_path(self, version: str) -> Optional[Path]:
         """Get the path to a specific Proton version's proton script"""
-        # Check compatibilitytools.d directories (user and system)
-        compat_paths = [
-            self.get_steam_compat_path(),  # User path
-            Path("/usr/share/steam/compatibilitytools.d")  # System path
-        ]
-
-        for compat_path in compat_paths:
-            proton_path = compat_path / version / "proton"
-            if proton_path.exists() and proton_path.is_file():
-                return proton_path
-
-        # If not found in compatibilitytools.d, try steamapps/common (official versions)
-        home = Path.home()
-        steam_common_paths = [
-            home / ".local/share/Steam/steamapps/common",
-            home / ".steam/steam/steamapps/common"
-        ]
-
-        for common_path in steam_common_paths:
-            if common_path.exists():
-                proton_path = common_path / version / "proton"
-                if proton_path.exists() and proton_path.is_file():
-                    return proton_path
-
-        return None
+        return self._version_index().get(version)
     
     def check_proton_exists(self, version: str) -> bool:
         """Check if a specific Proton version exists and is valid"""
@@ -292,7 +567,7 @@ class ProtonManager:
                 "name": version,
                 "path": str(version_path),
                 "version_text": version_text,
-                "size": sum(f.stat().st_size for f in version_path.rglob('*') if f.is_file())
+                "size": _parallel_dir_size(str(version_path))
             }
         except Exception as e:
             logging.error(f"[ProtonManager] Error getting version info for {version}: {e}")
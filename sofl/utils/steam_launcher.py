@@ -18,51 +18,226 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import os
+import pwd
 import subprocess
 import logging
 import shlex
 import vdf
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
 
 from sofl import shared
 
+# Whether we run inside the Flatpak sandbox, fixed for the process lifetime
+IN_FLATPAK = os.path.exists("/.flatpak-info")
 
-class SteamLauncher:
-    """Utilities for launching games through Steam API"""
+# Where the host root is mounted inside the Flatpak sandbox
+_HOST_ROOT = "/run/host"
 
-    @staticmethod
-    def check_steam_running(in_flatpak: bool = False) -> bool:
-        """Checks if Steam is running"""
+# Last check_steam_running answer per in_flatpak, reused for a short while
+_STEAM_RUNNING_TTL = 2.0
+_steam_running_cache: Dict[bool, Tuple[float, bool]] = {}
+
+# DLLs always loaded native (DXVK / VKD3D), user overrides are appended
+_WINE_DLL_BASE = "d3d11=n;d3d10=n;d3d10core=n;dxgi=n;openvr_api_dxvk=n;d3d12=n;d3d12core=n;d3d9=n;d3d8=n"
+
+# Settings-derived launch environment, keyed by the settings it was built from
+_env_template_cache: Dict[Tuple[str, bool], Dict[str, str]] = {}
+
+
+def _host_path(path: str) -> Optional[str]:
+    """Sandbox-visible location of a host path, or None if it is not exposed.
+
+    Host paths are reachable either under /run/host or at the same location
+    through --filesystem permissions (xdg-data/Steam in our manifest). Only a
+    hit is conclusive, a miss still has to be confirmed on the host.
+    """
+    for candidate in (_HOST_ROOT + path, path):
+        if os.path.lexists(candidate):
+            return candidate
+    return None
+
+
+def _process_running(name: str, proc_root: str) -> Optional[bool]:
+    """Looks for a process by command name in a procfs, None if it is unreadable"""
+    try:
+        with os.scandir(proc_root) as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "comm")) as comm:
+                        if comm.read().rstrip("\n") == name:
+                            return True
+                except OSError:
+                    # The process exited while we were scanning
+                    continue
+    except OSError:
+        return None
+    return False
+
+
+@lru_cache(maxsize=8)
+def _default_library_path(user_home: str) -> str:
+    return f"{user_home}/.local/share/Steam"
+
+
+@lru_cache(maxsize=8)
+def _default_client_path(user_home: str) -> str:
+    return f"{user_home}/.steam/steam"
+
+
+@lru_cache(maxsize=8)
+def _overlay_preload(user_home: str) -> str:
+    """LD_PRELOAD entries for the 32 and 64-bit Steam overlay renderers"""
+    library_path = _default_library_path(user_home)
+    return (
+        f"{library_path}/ubuntu12_32/gameoverlayrenderer.so:"
+        f"{library_path}/ubuntu12_64/gameoverlayrenderer.so"
+    )
+
+
+@lru_cache(maxsize=64)
+def _split_args(args: str) -> Tuple[str, ...]:
+    """shlex.split for the user's launch arguments, which rarely change"""
+    return tuple(shlex.split(args))
+
+
+@lru_cache(maxsize=16)
+def _flatpak_env_args(env_items: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Builds flatpak-spawn --env arguments, skipping empty values.
+
+    Keyed on the environment items, so relaunching with the same prefix and
+    settings reuses the arguments built for the previous launch.
+    """
+    env_args = []
+    for key, value in env_items:
+        str_value = str(value) if value is not None else ""
+        if str_value.strip():
+            env_args.append(f"--env={key}={str_value}")
+    return tuple(env_args)
+
+
+class _LazyCmd:
+    """Shell-quotes a command for logging only when the record is emitted"""
+
+    def __init__(self, argv: List[str]) -> None:
+        self.argv = argv
+
+    def __str__(self) -> str:
+        return shlex.join(map(str, self.argv))
+
+
+@lru_cache(maxsize=1)
+def _flatpak_spawn_has_directory() -> bool:
+    """Whether flatpak-spawn can set the working directory itself (--directory)"""
+    try:
+        result = subprocess.run(
+            ["flatpak-spawn", "--help"], capture_output=True, text=True
+        )
+        return "--directory" in result.stdout
+    except Exception:
+        return False
+
+
+class _NativeSpawner:
+    """Host access for a native install, everything is a direct syscall"""
+
+    def file_exists(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def is_executable(self, path: str) -> bool:
+        return os.access(path, os.X_OK)
+
+    def existing_files(self, paths: List[str]) -> Set[str]:
+        return {path for path in paths if os.path.isfile(path)}
+
+    def read_text(self, path: str) -> Optional[str]:
         try:
-            if in_flatpak:
-                result = subprocess.run(
-                    ["flatpak-spawn", "--host", "pidof", "steam"],
-                    capture_output=True,
-                    text=True,
-                )
-            else:
-                result = subprocess.run(
-                    ["pidof", "steam"], capture_output=True, text=True
-                )
-            return result.returncode == 0 and bool(result.stdout.strip())
-        except Exception as e:
-            logging.error(f"[SOFL] Failed to check Steam status: {str(e)}")
-            return False
+            with open(path, "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def home(self) -> str:
+        return os.path.expanduser("~")
+
+    def steam_running(self) -> bool:
+        running = _process_running("steam", "/proc")
+        if running is not None:
+            return running
+        result = subprocess.run(["pidof", "steam"], capture_output=True, text=True)
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    def spawn(self, cmd_argv: List[str], env: Dict[str, str], game_dir: Path) -> subprocess.Popen:
+        logging.info("[SOFL] Executing command: %s", _LazyCmd(cmd_argv))
+        return subprocess.Popen(cmd_argv, cwd=str(game_dir), env=os.environ | env, start_new_session=True)
+
+
+class _FlatpakSpawner:
+    """Host access from inside the Flatpak sandbox.
+
+    Answers locally through _host_path() where the host filesystem is
+    visible and only falls back to flatpak-spawn --host otherwise.
+    """
 
     @staticmethod
-    def get_host_home(in_flatpak: bool = False) -> str:
-        """Gets host home directory"""
-        if not in_flatpak:
-            return os.path.expanduser("~")
+    def _host_run(*argv: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["flatpak-spawn", "--host", *argv], capture_output=True, text=True
+        )
+
+    def file_exists(self, path: str) -> bool:
+        local_path = _host_path(path)
+        if local_path is not None:
+            return os.path.isfile(local_path)
+        return self._host_run("test", "-f", path).returncode == 0
+
+    def is_executable(self, path: str) -> bool:
+        local_path = _host_path(path)
+        if local_path is not None and os.access(local_path, os.X_OK):
+            return True
+        # A local miss may just be a hidden or noexec mount, ask the host
+        return self._host_run("test", "-x", path).returncode == 0
+
+    def existing_files(self, paths: List[str]) -> Set[str]:
+        existing = set()
+        unresolved = []
+        for path in paths:
+            local_path = _host_path(path)
+            if local_path is not None and os.path.isfile(local_path):
+                existing.add(path)
+            else:
+                unresolved.append(path)
 
+        if unresolved:
+            script = 'for p in "$@"; do test -f "$p" && printf "%s\\0" "$p"; done; true'
+            result = self._host_run("sh", "-c", script, "sh", *unresolved)
+            existing.update(path for path in result.stdout.split("\0") if path)
+
+        return existing
+
+    def read_text(self, path: str) -> Optional[str]:
+        result = self._host_run("cat", path)
+        return result.stdout if result.returncode == 0 else None
+
+    def home(self) -> str:
+        # Resolve locally when the sandbox already exposes the host home
+        host_home = os.environ.get("HOST_HOME")
+        if host_home:
+            return host_home
         try:
-            result = subprocess.run(
-                ["flatpak-spawn", "--host", "printenv", "HOME"],
-                capture_output=True,
-                text=True,
-            )
+            user = pwd.getpwuid(os.getuid()).pw_name
+            if os.path.isdir(os.path.join(_HOST_ROOT, "home", user)):
+                return os.path.join("/home", user)
+        except KeyError:
+            pass
+
+        try:
+            result = self._host_run("printenv", "HOME")
             if result.returncode == 0:
                 return result.stdout.strip()
         except Exception as e:
@@ -70,27 +245,71 @@ class SteamLauncher:
 
         return os.path.expanduser("~")
 
+    def steam_running(self) -> bool:
+        # The sandbox has its own PID namespace, so only the host procfs counts
+        running = _process_running("steam", _HOST_ROOT + "/proc")
+        if running is not None:
+            return running
+        result = self._host_run("pidof", "steam")
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    def spawn(self, cmd_argv: List[str], env: Dict[str, str], game_dir: Path) -> subprocess.Popen:
+        full_cmd = ["flatpak-spawn", "--host", *_flatpak_env_args(tuple(env.items())), *cmd_argv]
+
+        # Add directory change
+        if game_dir:
+            if _flatpak_spawn_has_directory():
+                full_cmd.insert(2, f"--directory={game_dir}")
+            else:
+                full_cmd = ["sh", "-c", f"cd {shlex.quote(str(game_dir))} && exec \"$@\"", "sh"] + full_cmd
+
+        logging.info("[SOFL] Executing command via flatpak-spawn: %s", _LazyCmd(full_cmd))
+        return subprocess.Popen(full_cmd, start_new_session=True)
+
+
+# Host access strategy per in_flatpak value, built once
+_SPAWNERS = {False: _NativeSpawner(), True: _FlatpakSpawner()}
+
+
+class SteamLauncher:
+    """Utilities for launching games through Steam API"""
+
+    @staticmethod
+    def check_steam_running(in_flatpak: bool = IN_FLATPAK) -> bool:
+        """Checks if Steam is running"""
+        hit = _steam_running_cache.get(in_flatpak)
+        if hit and monotonic() - hit[0] < _STEAM_RUNNING_TTL:
+            return hit[1]
+
+        try:
+            running = _SPAWNERS[in_flatpak].steam_running()
+        except Exception as e:
+            logging.error(f"[SOFL] Failed to check Steam status: {str(e)}")
+            running = False
+        _steam_running_cache[in_flatpak] = (monotonic(), running)
+        return running
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def get_host_home(in_flatpak: bool = IN_FLATPAK) -> str:
+        """Gets host home directory"""
+        return _SPAWNERS[in_flatpak].home()
+
     @staticmethod
-    def check_proton_exists(proton_version: str, steam_home: str, in_flatpak: bool = False) -> bool:
+    def check_proton_exists(proton_version: str, steam_home: str, in_flatpak: bool = IN_FLATPAK) -> bool:
         """Checks Proton version existence"""
         proton_path = os.path.join(
             steam_home, "compatibilitytools.d", proton_version, "proton"
         )
 
+        # The proton script is only usable if it can be executed
         try:
-            if in_flatpak:
-                result = subprocess.run(
-                    ["flatpak-spawn", "--host", "test", "-e", proton_path],
-                    capture_output=True,
-                )
-                return result.returncode == 0
-            else:
-                return os.path.exists(proton_path)
+            return _SPAWNERS[in_flatpak].is_executable(proton_path)
         except Exception:
             return False
 
     @staticmethod
-    def find_steam_runtime(steam_home: str, in_flatpak: bool = False) -> Optional[str]:
+    def find_steam_runtime(steam_home: str, in_flatpak: bool = IN_FLATPAK) -> Optional[str]:
         """Finds Steam Runtime in Steam libraries"""
         library_folders_path = os.path.join(
             steam_home, ".steam/steam/steamapps/libraryfolders.vdf"
@@ -98,52 +317,49 @@ class SteamLauncher:
 
         try:
             library_data = None
-            if in_flatpak:
-                try:
-                    result = subprocess.run(
-                        ["flatpak-spawn", "--host", "cat", library_folders_path],
-                        capture_output=True,
-                        text=True,
-                    )
-                    if result.returncode == 0:
-                        try:
-                            library_data = vdf.loads(result.stdout)
-                        except Exception:
-                            library_data = vdf.load(StringIO(result.stdout))
-                except Exception as e:
-                    logging.debug(f"[SOFL] Could not read host libraryfolders.vdf: {e}")
-            else:
-                if os.path.exists(library_folders_path):
-                    with open(library_folders_path, "r") as f:
-                        library_data = vdf.load(f)
+            try:
+                library_text = _SPAWNERS[in_flatpak].read_text(library_folders_path)
+                if library_text is not None:
+                    try:
+                        library_data = vdf.loads(library_text)
+                    except Exception:
+                        library_data = vdf.load(StringIO(library_text))
+            except Exception as e:
+                logging.debug(f"[SOFL] Could not read libraryfolders.vdf: {e}")
 
             # Look for SteamLinuxRuntime_sniper
             if library_data and "libraryfolders" in library_data:
-                for folder_data in library_data["libraryfolders"].values():
-                    if "apps" in folder_data and "1628350" in folder_data["apps"]:
-                        runtime_path = os.path.join(
-                            folder_data["path"],
-                            "steamapps/common/SteamLinuxRuntime_sniper/run",
-                        )
-                        if SteamLauncher._check_file_exists(runtime_path, in_flatpak):
-                            return runtime_path
+                runtime_paths = [
+                    os.path.join(
+                        folder_data["path"],
+                        "steamapps/common/SteamLinuxRuntime_sniper/run",
+                    )
+                    for folder_data in library_data["libraryfolders"].values()
+                    if "apps" in folder_data and "1628350" in folder_data["apps"]
+                ]
+                existing = SteamLauncher._batch_check_files_exist(runtime_paths, in_flatpak)
+                for runtime_path in runtime_paths:
+                    if runtime_path in existing:
+                        return runtime_path
         except Exception as e:
             logging.error(f"[SOFL] Error finding Steam Runtime: {str(e)}")
 
         return None
 
     @staticmethod
-    def _check_file_exists(file_path: str, in_flatpak: bool = False) -> bool:
+    def _batch_check_files_exist(paths: List[str], in_flatpak: bool = IN_FLATPAK) -> Set[str]:
+        """Returns the subset of paths that are regular files, with at most one host round trip"""
+        try:
+            return _SPAWNERS[in_flatpak].existing_files(paths)
+        except Exception as e:
+            logging.error(f"[SOFL] Failed to check host paths: {e}")
+            return set()
+
+    @staticmethod
+    def _check_file_exists(file_path: str, in_flatpak: bool = IN_FLATPAK) -> bool:
         """Checks file existence"""
         try:
-            if in_flatpak:
-                result = subprocess.run(
-                    ["flatpak-spawn", "--host", "test", "-f", file_path],
-                    capture_output=True,
-                )
-                return result.returncode == 0
-            else:
-                return os.path.isfile(file_path)
+            return _SPAWNERS[in_flatpak].file_exists(file_path)
         except Exception:
             return False
 
@@ -153,19 +369,26 @@ class SteamLauncher:
         dll_overrides = shared.schema.get_string("online-fix-dll-overrides")
         debug_mode = shared.schema.get_boolean("online-fix-debug-mode")
 
-        # Base environment variables
-        env = {
-            "WINEDLLOVERRIDES": f"d3d11=n;d3d10=n;d3d10core=n;dxgi=n;openvr_api_dxvk=n;d3d12=n;d3d12core=n;d3d9=n;d3d8=n;{dll_overrides}",
-            "WINEDEBUG": "+warn,+err,+trace" if debug_mode else "-all",
-            "STEAM_COMPAT_DATA_PATH": prefix_path,
-            "STEAM_COMPAT_CLIENT_INSTALL_PATH": f"{user_home}/.steam/steam",
-        }
+        # Base environment variables, the settings-only part is built once per settings
+        key = (dll_overrides, debug_mode)
+        template = _env_template_cache.get(key)
+        if template is None:
+            template = {
+                "WINEDLLOVERRIDES": f"{_WINE_DLL_BASE};{dll_overrides}" if dll_overrides else _WINE_DLL_BASE,
+                "WINEDEBUG": "+warn,+err,+trace" if debug_mode else "-all",
+            }
+            _env_template_cache.clear()
+            _env_template_cache[key] = template
+
+        env = template.copy()
+        env["STEAM_COMPAT_DATA_PATH"] = prefix_path
+        env["STEAM_COMPAT_CLIENT_INSTALL_PATH"] = _default_client_path(user_home)
 
         # Add Steam Overlay if enabled
         use_steam_overlay = shared.schema.get_boolean("online-fix-use-steam-overlay")
         if use_steam_overlay:
             existing_preload = env.get("LD_PRELOAD", "")
-            new_preload_paths = f"{user_home}/.local/share/Steam/ubuntu12_32/gameoverlayrenderer.so:{user_home}/.local/share/Steam/ubuntu12_64/gameoverlayrenderer.so"
+            new_preload_paths = _overlay_preload(user_home)
 
             preload_parts = [part for part in [existing_preload, new_preload_paths] if part]
             env["LD_PRELOAD"] = ":".join(preload_parts)
@@ -187,16 +410,16 @@ class SteamLauncher:
             cmd_argv.insert(0, steam_runtime_path)
 
         # Safely add arguments
-        if args_before:
+        if args_before and not args_before.isspace():
             try:
-                args_before_list = shlex.split(args_before)
-                cmd_argv = args_before_list + cmd_argv
+                args_before_list = _split_args(args_before)
+                cmd_argv = [*args_before_list, *cmd_argv]
             except ValueError as e:
                 logging.warning(f"[SOFL] Failed to parse args_before '{args_before}': {e}")
 
-        if args_after:
+        if args_after and not args_after.isspace():
             try:
-                args_after_list = shlex.split(args_after)
+                args_after_list = _split_args(args_after)
                 cmd_argv.extend(args_after_list)
             except ValueError as e:
                 logging.warning(f"[SOFL] Failed to parse args_after '{args_after}': {e}")
@@ -204,49 +427,11 @@ class SteamLauncher:
         return cmd_argv
 
     @staticmethod
-    def launch_game(cmd_argv: List[str], env: Dict[str, str], game_dir: Path, in_flatpak: bool = False) -> None:
+    def launch_game(cmd_argv: List[str], env: Dict[str, str], game_dir: Path, in_flatpak: bool = IN_FLATPAK) -> None:
         """Launches game in appropriate environment"""
-        if in_flatpak:
-            # In Flatpak use flatpak-spawn
-            env_args = []
-            for key, value in env.items():
-                str_value = str(value) if value is not None else ""
-                if str_value.strip():
-                    env_args.append(f"--env={key}={str_value}")
-
-            full_cmd = ["flatpak-spawn", "--host"] + env_args + cmd_argv
-
-            # Add directory change
-            if game_dir:
-                full_cmd = ["sh", "-c", f"cd {shlex.quote(str(game_dir))} && exec \"$@\"", "sh"] + full_cmd
-
-            logging.info(f"[SOFL] Executing command via flatpak-spawn: {' '.join(shlex.quote(str(arg)) for arg in full_cmd)}")
-            subprocess.Popen(full_cmd, start_new_session=True)
-        else:
-            # In native environment launch directly
-            logging.info(f"[SOFL] Executing command: {' '.join(shlex.quote(str(arg)) for arg in cmd_argv)}")
-            subprocess.Popen(cmd_argv, cwd=str(game_dir), env={**os.environ, **env}, start_new_session=True)
+        _SPAWNERS[in_flatpak].spawn(cmd_argv, env, game_dir)
 
     @staticmethod
-    def launch_game_with_tracking(cmd_argv: List[str], env: Dict[str, str], game_dir: Path, in_flatpak: bool = False):
+    def launch_game_with_tracking(cmd_argv: List[str], env: Dict[str, str], game_dir: Path, in_flatpak: bool = IN_FLATPAK):
         """Launches game in appropriate environment and returns process for tracking"""
-        if in_flatpak:
-            # In Flatpak use flatpak-spawn
-            env_args = []
-            for key, value in env.items():
-                str_value = str(value) if value is not None else ""
-                if str_value.strip():
-                    env_args.append(f"--env={key}={str_value}")
-
-            full_cmd = ["flatpak-spawn", "--host"] + env_args + cmd_argv
-
-            # Add directory change
-            if game_dir:
-                full_cmd = ["sh", "-c", f"cd {shlex.quote(str(game_dir))} && exec \"$@\"", "sh"] + full_cmd
-
-            logging.info(f"[SOFL] Executing command via flatpak-spawn: {' '.join(shlex.quote(str(arg)) for arg in full_cmd)}")
-            return subprocess.Popen(full_cmd, start_new_session=True)
-        else:
-            # In native environment launch directly
-            logging.info(f"[SOFL] Executing command: {' '.join(shlex.quote(str(arg)) for arg in cmd_argv)}")
-            return subprocess.Popen(cmd_argv, cwd=str(game_dir), env={**os.environ, **env}, start_new_session=True)
+        return _SPAWNERS[in_flatpak].spawn(cmd_argv, env, game_dir)